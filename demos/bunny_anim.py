@@ -1,7 +1,10 @@
 """Simple ASCII bunny animation test."""
 import sys
+import time
 from blessed import Terminal
 
+FRAME_TIME = 0.11  # Seconds per animation frame
+
 FRAMES = [
     # Frame 1
     """\
@@ -69,34 +72,60 @@ FRAMES = [
                                        """,
 ]
 
+def build_blits(term):
+    """
+    Pre-render each frame into positioned strings (frames never change).
+    Returns (full, delta): full[i] draws all of frame i, delta[i] only the
+    lines that differ from the frame before it in the cycle.
+    """
+    rows = []
+    for frame in FRAMES:
+        frame_lines = frame.split('\n')
+        start_y = (term.height - len(frame_lines)) // 2
+        # Pad lines to consistent width to overwrite old content
+        rows.append({start_y + i: line.ljust(45) for i, line in enumerate(frame_lines)})
+
+    full = [''.join(term.move_xy(5, y) + line for y, line in r.items()) for r in rows]
+    delta = [''.join(term.move_xy(5, y) + line for y, line in r.items() if rows[i - 1].get(y) != line)
+             for i, r in enumerate(rows)]
+    return full, delta
+
 def main():
     term = Terminal()
     frame_idx = 0
+    height = None
 
     out = sys.stdout.write
     flush = sys.stdout.flush
 
     with term.fullscreen(), term.cbreak(), term.hidden_cursor():
-        # Clear once at start
-        out(term.home + term.clear)
-        flush()
-
+        next_frame = time.monotonic()
         while True:
-            # Draw current frame (overwrite previous)
-            frame_lines = FRAMES[frame_idx].split('\n')
-            start_y = (term.height - len(frame_lines)) // 2
-
-            for i, line in enumerate(frame_lines):
-                # Pad line to consistent width to overwrite old content
-                out(term.move_xy(5, start_y + i) + line.ljust(45))
+            # Recenter after a resize (and at start): rebuild the blits for the
+            # new height, clear, and redraw the static status line at the new
+            # bottom row - the frame area never touches it in between
+            if term.height != height:
+                height = term.height
+                full, delta = build_blits(term)
+                blits = full
+                out(term.home + term.clear)
+                out(term.move_xy(0, height - 1) + "Press 'q' to quit")
 
-            out(term.move_xy(0, term.height - 1) + "Press 'q' to quit")
+            # Draw current frame (only lines that changed after the first)
+            out(blits[frame_idx])
+            blits = delta
             flush()
 
-            # Check for input
-            key = term.inkey(timeout=0.11)
-            if key.lower() == 'q':
-                break
+            # Pace on a monotonic deadline: stray keys don't speed up the
+            # animation, and a backlog (slow terminal) is dropped, not replayed.
+            # Input is polled at least once per frame, even after an overrun.
+            next_frame = max(next_frame + FRAME_TIME, time.monotonic())
+            while True:
+                remaining = max(next_frame - time.monotonic(), 0)
+                if term.inkey(timeout=remaining).lower() == 'q':
+                    return
+                if next_frame <= time.monotonic():
+                    break
 
             frame_idx = (frame_idx + 1) % len(FRAMES)
 
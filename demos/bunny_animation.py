@@ -1,5 +1,39 @@
 """ASCII bunny animation - vanilla Python."""
-import sys, os, time, msvcrt
+import sys, os, time, msvcrt, ctypes
+
+kernel32 = ctypes.windll.kernel32
+STDIN = kernel32.GetStdHandle(-10)  # STD_INPUT_HANDLE
+WAIT_OBJECT_0 = 0
+KEY_EVENT = 0x0001
+
+
+class INPUT_RECORD(ctypes.Structure):
+    """Console INPUT_RECORD, laid out only as far as the key-down flag."""
+    _fields_ = [("EventType", ctypes.c_ushort),
+                ("bKeyDown", ctypes.c_int),  # KEY_EVENT_RECORD.bKeyDown
+                ("_rest", ctypes.c_byte * 12)]
+
+
+def wait_key(timeout):
+    """Block on the console input handle until a key arrives or timeout passes."""
+    deadline = time.monotonic() + timeout
+    record, count = INPUT_RECORD(), ctypes.c_ulong()
+    while (remaining := deadline - time.monotonic()) > 0:
+        if kernel32.WaitForSingleObject(STDIN, int(remaining * 1000)) != WAIT_OBJECT_0:
+            return None
+        if msvcrt.kbhit():
+            return msvcrt.getch()
+        # Signaled with no character waiting: the oldest record is usually a
+        # key-up, else a key-down without a character (Shift...) or a focus/
+        # mouse/resize event. Drop just that record, so a keypress landing
+        # after kbhit() stays queued; if the oldest record is itself a fresh
+        # character key-down, kbhit() now sees it and the next pass reads it.
+        if not kernel32.PeekConsoleInputW(STDIN, ctypes.byref(record), 1, ctypes.byref(count)) or not count.value:
+            continue
+        if record.EventType == KEY_EVENT and record.bKeyDown and msvcrt.kbhit():
+            continue
+        kernel32.ReadConsoleInputW(STDIN, ctypes.byref(record), 1, ctypes.byref(count))
+    return None
 
 FRAMES = [
     """\
@@ -62,18 +96,22 @@ FRAMES = [
 
 print("\033[?25l\033[2J\033[H", end="")  # hide cursor, clear, home
 i = 0
+status_h = None
 while True:
     h = os.get_terminal_size().lines
     lines = FRAMES[i].split("\n")
     y = (h - len(lines)) // 2
     for j, line in enumerate(lines):
         print(f"\033[{y+j};6H{line:45}", end="")
-    print(f"\033[{h};1HPress 'q' to quit", end="", flush=True)
+    if h != status_h:  # static status line: only redraw after a resize
+        print(f"\033[{h};1HPress 'q' to quit", end="")
+        status_h = h
+    sys.stdout.flush()
 
-    t = time.time()
-    while time.time() - t < 0.11:
-        if msvcrt.kbhit() and msvcrt.getch().lower() == b'q':
+    deadline = time.monotonic() + 0.11
+    while (remaining := deadline - time.monotonic()) > 0:
+        key = wait_key(remaining)
+        if key is not None and key.lower() == b'q':
             print("\033[?25h\033[2J\033[H", end="")
             sys.exit()
-        time.sleep(0.01)
     i = (i + 1) % 4
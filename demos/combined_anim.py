@@ -1,7 +1,10 @@
 """Combined bunny and tree animation with proper layering."""
 import sys
+import time
 from blessed import Terminal
 
+FRAME_TIME = 0.10  # Seconds per animation frame
+
 BUNNY_FRAMES = [
     """\
        +-
@@ -262,30 +265,43 @@ class Screen:
         self.height = term.height - 1
         self.current = [[' '] * self.width for _ in range(self.height)]
         self.previous = [[' '] * self.width for _ in range(self.height)]
+        self.drawn = []  # (row, start, end) spans touched by sprites since last clear
 
     def clear(self):
-        """Clear current buffer."""
-        for row in self.current:
-            for i in range(len(row)):
-                row[i] = ' '
+        """Clear current buffer by erasing only the spans sprites drew into."""
+        for row, start, end in self.drawn:
+            self.current[row][start:end] = [' '] * (end - start)
+        self.drawn.clear()
 
     def draw_sprite(self, lines, x, y):
         """Draw sprite to current buffer (non-space chars only)."""
         for i, line in enumerate(lines):
             row = y + i
             if 0 <= row < self.height:
+                start, end = max(x, 0), min(x + len(line), self.width)
+                if start < end:
+                    self.drawn.append((row, start, end))
                 for j, ch in enumerate(line):
                     col = x + j
                     if 0 <= col < self.width and ch != ' ':
                         self.current[row][col] = ch
 
     def render(self, out):
-        """Output only changed characters."""
-        for row in range(self.height):
+        """
+        Output only changed characters, batched into a single write.
+        Returns False (and writes nothing) when no cell changed.
+        """
+        parts = []
+        move_xy = self.term.move_xy
+        for row, (cur, prev) in enumerate(zip(self.current, self.previous)):
             for col in range(self.width):
-                if self.current[row][col] != self.previous[row][col]:
-                    out(self.term.move_xy(col, row) + self.current[row][col])
-                    self.previous[row][col] = self.current[row][col]
+                if cur[col] != prev[col]:
+                    parts.append(move_xy(col, row) + cur[col])
+                    prev[col] = cur[col]
+        if not parts:
+            return False
+        out(''.join(parts))
+        return True
 
 
 def main():
@@ -298,12 +314,20 @@ def main():
     flush = sys.stdout.flush
 
     with term.fullscreen(), term.cbreak(), term.hidden_cursor():
-        out(term.home + term.clear)
-        flush()
-
-        screen = Screen(term)
+        size = None
 
+        next_frame = time.monotonic()
         while True:
+            # Start over after a resize (and at start): a screen buffer sized
+            # to the terminal, a cleared display, and the static status line
+            # on the new bottom row - sprites never touch it in between
+            if (term.width, term.height) != size:
+                size = (term.width, term.height)
+                screen = Screen(term)
+                out(term.home + term.clear)
+                out(term.move_xy(0, term.height - 1) + "Press 'q' to quit")
+                flush()
+
             screen.clear()
 
             # Draw tree (background)
@@ -317,14 +341,20 @@ def main():
             bunny_y = screen.height - len(bunny_lines)
             screen.draw_sprite(bunny_lines, bunny_x, bunny_y)
 
-            # Render changes only
-            screen.render(out)
-            out(term.move_xy(0, term.height - 1) + "Press 'q' to quit")
-            flush()
+            # Render changes only; skip terminal I/O entirely when nothing changed
+            if screen.render(out):
+                flush()
 
-            key = term.inkey(timeout=0.10)
-            if key.lower() == 'q':
-                break
+            # Pace on a monotonic deadline: stray keys don't speed up the
+            # animation, and a backlog (slow terminal) is dropped, not replayed.
+            # Input is polled at least once per frame, even after an overrun.
+            next_frame = max(next_frame + FRAME_TIME, time.monotonic())
+            while True:
+                remaining = max(next_frame - time.monotonic(), 0)
+                if term.inkey(timeout=remaining).lower() == 'q':
+                    return
+                if next_frame <= time.monotonic():
+                    break
 
             bunny_idx = (bunny_idx + 1) % len(BUNNY_FRAMES)
             tree_idx = (tree_idx + 1) % len(TREE_FRAMES)
@@ -10,31 +10,168 @@ Controls:
 - Q: Quit
 """
 
-import sys
 import os
+import queue
+import sys
+import threading
 import time
+from contextlib import contextmanager
 
 # Fix Windows encoding for Unicode/emoji support
 if sys.platform == 'win32':
+    import ctypes
     sys.stdout.reconfigure(encoding='utf-8')
-    os.system('chcp 65001 > nul 2>&1')
+    # Set the console code page directly instead of spawning `chcp 65001`
+    ctypes.windll.kernel32.SetConsoleOutputCP(65001)
+    ctypes.windll.kernel32.SetConsoleCP(65001)
 
 from blessed import Terminal
-import wcwidth
 import random
+from functools import lru_cache
+
+# Display width of the player emoji (🐇 is double-width)
+PLAYER_WIDTH = 2
 
-def char_width(char: str) -> int:
-    """Get display width of a character (emoji = 2, ascii = 1)."""
-    w = wcwidth.wcswidth(char)
-    return max(1, w)
+# How long each raised jump frame is held, in time.monotonic_ns() nanoseconds
+JUMP_FRAME_NS = 150_000_000
 
 # Tile types
 SKY = 0
 GRASS = 1
 DIRT = 2
 
+# World byte layout: bits 0-1 hold the tile type, bits 2-3 the tree cell kind
+# standing on it (none/leaf/trunk), so one byte answers both questions
+TILE_MASK = 0x03
+TREE_MASK = 0x0C
+TREE_LEAF = 0x04
+TREE_TRUNK = 0x08
+
+# Key bindings, matched against a key's blessed name or its lowercased char
+QUIT_KEYS = frozenset({'q'})
+LEFT_KEYS = frozenset({'a', 'KEY_LEFT'})
+RIGHT_KEYS = frozenset({'d', 'KEY_RIGHT'})
+DOWN_KEYS = frozenset({'s', 'KEY_DOWN'})
+UP_KEYS = frozenset({'w', 'KEY_UP'})
+
+# Synchronized output (DEC mode 2026): terminals that support it hold rendering
+# between BSU and ESU so a frame appears at once; others ignore the sequences
+BSU = '\x1b[?2026h'
+ESU = '\x1b[?2026l'
+
+# Output buffer - escape sequences are queued here and written once per frame,
+# encoded once and handed straight to the fd (bypassing sys.stdout's text layer)
+_out = []
+STDOUT_FD = sys.stdout.fileno()
+
+# Encoded frames wait here for the writer thread, so a slow terminal write never
+# stalls input handling. Bounded: if the terminal falls this far behind, flush()
+# blocks until it catches up.
+_frames = queue.Queue(maxsize=64)
+_writer_error = None  # OSError that stopped the writer thread (EIO on hangup, EPIPE)
+
+def emit(s):
+    """Queue output for the next flush."""
+    _out.append(s)
+
+def flush():
+    """Hand everything queued since the last flush to the writer as one synchronized update."""
+    if _out:
+        buf = (BSU + ''.join(_out) + ESU).encode('utf-8')
+        _out.clear()
+        sys.stdout.flush()  # Anything blessed printed itself must go out first
+        _put_frame(buf)
+
+def _put_frame(item):
+    """Queue an item for the writer; once the writer has died, raise its error instead of blocking."""
+    while True:
+        if _writer_error is not None:
+            raise _writer_error
+        try:
+            _frames.put(item, timeout=0.1)
+            return
+        except queue.Full:
+            pass
+
+def _write_frames():
+    """Writer thread: write queued frames to stdout until a None sentinel arrives."""
+    global _writer_error
+    while True:
+        frame = _frames.get()
+        # Coalesce frames that piled up while the last write was in progress
+        pending = [frame]
+        while frame is not None and not _frames.empty():
+            frame = _frames.get_nowait()
+            pending.append(frame)
+        if frame is None:
+            pending.pop()
+        buf = memoryview(b''.join(pending))
+        try:
+            while buf:
+                buf = buf[os.write(STDOUT_FD, buf):]
+        except OSError as e:
+            _writer_error = e  # Reported by the next flush() or on frame_writer() exit
+            return
+        if frame is None:
+            return
+
+@contextmanager
+def frame_writer():
+    """Run frame writes on a background thread; every queued frame is written before exit.
+
+    A write error in the thread is raised from flush(), or from here on exit.
+    """
+    thread = threading.Thread(target=_write_frames, daemon=True)
+    thread.start()
+    try:
+        yield
+    finally:
+        try:
+            _put_frame(None)
+        except OSError:
+            pass  # Writer already stopped; its error is raised below
+        thread.join()
+    if _writer_error is not None:
+        raise _writer_error
+
+# Instruction box borders (built once)
+BOX_INNER = 46  # Content width
+BOX_TOP = '┌' + '─' * BOX_INNER + '─┐'
+BOX_BOTTOM = '└' + '─' * BOX_INNER + '─┘'
+
+class Cloud:
+    """A drifting multi-cell cloud. pattern is a list of (dx, dy, char) cells,
+    cells the on-screen subset as (x, y, cell string), rebuilt when it moves."""
+    __slots__ = ('x', 'y', 'speed_ns', 'pattern', 'last_move_ns', 'tint', 'cells')
+
+    def __init__(self, x, y, speed_ns, pattern, last_move_ns, tint):
+        self.x = x
+        self.y = y
+        self.speed_ns = speed_ns  # Times are integer time.monotonic_ns() nanoseconds
+        self.pattern = pattern
+        self.last_move_ns = last_move_ns
+        self.tint = tint
+        self.cells = None
+
+class Butterfly:
+    """A butterfly fluttering in the upper sky rows."""
+    __slots__ = ('x', 'y', 'last_move_ns', 'emoji', 'speed_ns', 'width')
+
+    def __init__(self, x, y, last_move_ns, speed_ns, emoji='🦋', width=2):
+        self.x = x
+        self.y = y
+        self.last_move_ns = last_move_ns
+        self.emoji = emoji
+        self.speed_ns = speed_ns
+        self.width = width  # Display width of the emoji, fixed so no wcwidth lookup is needed
+
 def main():
     term = Terminal()
+    # Escape-sequence builders are memoized so repeated positions/colors are a
+    # dict lookup instead of blessed's Python-level formatting
+    move_xy = lru_cache(maxsize=4096)(term.move_xy)
+    fg_rgb = lru_cache(maxsize=256)(term.color_rgb)
+    bg_rgb = lru_cache(maxsize=256)(term.on_color_rgb)
 
     # Play area - auto-size to terminal
     area_x = 2
@@ -42,18 +179,22 @@ def main():
     area_w = term.width - 4      # Leave 2 chars padding on each side
     area_h = term.height - 7     # Leave room for header (1) + gap (1) + instructions (3) + padding (2)
 
-    # Terrain grid - top portion sky, rest is grass
+    # World grid - top portion sky, rest is grass. One flat row-major
+    # bytearray, one byte per cell packing the tile and tree bits (see TILE_MASK).
     sky_rows = max(6, area_h // 3)  # At least 6 rows, or 1/3 of height
-    terrain = []
-    for row in range(area_h):
-        if row < sky_rows:
-            terrain.append([SKY] * area_w)
-        else:
-            terrain.append([GRASS] * area_w)
+    world = bytearray(area_w * area_h)  # Zero-filled == SKY, no tree
+    world[sky_rows * area_w:] = bytes([GRASS]) * ((area_h - sky_rows) * area_w)
 
     # Ground level - the Y position where bunny stands ON TOP of grass
     ground_y = area_y + sky_rows - 1
 
+    # Precomputed bounds (exclusive ends) so hot paths don't redo the sums
+    area_right = area_x + area_w
+    area_bottom = area_y + area_h
+    sky_bottom = area_y + sky_rows
+    fly_top = area_y + 2  # Butterflies stay in rows 2-4 of the sky
+    fly_bottom = area_y + 4
+
     # Player position (tile coordinates)
     player_x = area_x + area_w // 4  # Start 1/4 from left
     player_y = ground_y  # Start on ground
@@ -70,7 +211,7 @@ def main():
         row = gy - area_y
         col = gx - area_x
         if 0 <= row < area_h and 0 <= col < area_w:
-            return terrain[row][col]
+            return world[row * area_w + col] & TILE_MASK
         return -1  # Out of bounds
 
     def set_tile(gx, gy, tile):
@@ -78,37 +219,98 @@ def main():
         row = gy - area_y
         col = gx - area_x
         if 0 <= row < area_h and 0 <= col < area_w:
-            terrain[row][col] = tile
+            idx = row * area_w + col
+            world[idx] = (world[idx] & TREE_MASK) | tile
 
     # RGB Colors
-    sky_color = term.on_color_rgb(70, 130, 180)  # Steel blue (darker sky)
+    sky_color = bg_rgb(70, 130, 180)  # Steel blue (darker sky)
 
-    # Grass color variations (different greens)
+    # Grass color variations (different greens) - length must stay a power of
+    # two, lookups mask with & 3
     grass_colors = [
-        term.on_color_rgb(34, 139, 34),   # Forest green
-        term.on_color_rgb(0, 128, 0),     # Green
-        term.on_color_rgb(50, 150, 50),   # Lighter green
-        term.on_color_rgb(34, 120, 34),   # Darker forest
+        bg_rgb(34, 139, 34),   # Forest green
+        bg_rgb(0, 128, 0),     # Green
+        bg_rgb(50, 150, 50),   # Lighter green
+        bg_rgb(34, 120, 34),   # Darker forest
     ]
 
-    # Dirt color variations (different browns)
+    # Dirt color variations (different browns) - same power-of-two rule
     dirt_colors = [
-        term.on_color_rgb(139, 90, 43),   # Saddle brown
-        term.on_color_rgb(120, 80, 40),   # Darker brown
-        term.on_color_rgb(150, 100, 50),  # Lighter brown
-        term.on_color_rgb(130, 85, 45),   # Medium brown
+        bg_rgb(139, 90, 43),   # Saddle brown
+        bg_rgb(120, 80, 40),   # Darker brown
+        bg_rgb(150, 100, 50),  # Lighter brown
+        bg_rgb(130, 85, 45),   # Medium brown
     ]
 
+    # Pre-rendered single-cell strings (SGR + space) for every tile color,
+    # so drawing a tile is a lookup instead of a FormattingString call
+    tile_cells = {color: color + ' ' for color in [sky_color, *grass_colors, *dirt_colors]}
+
     def get_grass_color(x, y):
         """Get a deterministic grass color based on position."""
-        idx = ((x * 7) + (y * 13)) % len(grass_colors)
+        idx = ((x * 7) + (y * 13)) & 3
         return grass_colors[idx]
 
     def get_dirt_color(x, y):
         """Get a deterministic dirt color based on position."""
-        idx = ((x * 11) + (y * 17)) % len(dirt_colors)
+        idx = ((x * 11) + (y * 17)) & 3
         return dirt_colors[idx]
 
+    # Diff-based screen buffer (ncurses-style): draw calls put() cell strings into
+    # back_buf, present() emits only the cells that differ from front_buf (what is
+    # already on the terminal), one cursor move per contiguous run. A cell string
+    # is an SGR prefix followed by exactly one character, with no trailing reset,
+    # so runs of cells sharing a style collapse to one SGR plus their characters.
+    front_buf = {}  # (x, y) -> cell string on screen
+    back_buf = {}   # (x, y) -> cell string queued since the last present()
+
+    def put(x, y, cell, width=1):
+        """Queue a cell; wide glyphs mark the columns they cover with ''."""
+        back_buf[(x, y)] = cell
+        for dx in range(1, width):
+            back_buf[(x + dx, y)] = ''
+
+    def present():
+        """Emit queued cells that changed since they were last drawn."""
+        cursor = None  # Where the terminal cursor is known to be, if anywhere
+        style = None   # SGR prefix currently in effect, if set by this present
+        for x, y in sorted(back_buf, key=lambda pos: (pos[1], pos[0])):
+            cell = back_buf[(x, y)]
+            if front_buf.get((x, y)) == cell:
+                continue
+            front_buf[(x, y)] = cell
+            if not cell:
+                # Covered by the wide glyph to the left, which already advanced the cursor
+                if cursor == (x, y):
+                    cursor = (x + 1, y)
+                continue
+            if cursor != (x, y):
+                emit(move_xy(x, y))
+            cell_style = cell[:-1]
+            if cell_style == style:
+                emit(cell[-1])
+            else:
+                emit(cell)
+                style = cell_style
+            cursor = (x + 1, y)
+        if style is not None:
+            emit(term.normal)
+        back_buf.clear()
+
+    def join_cells(cells):
+        """Join a row of contiguous cell strings, one SGR per same-style run."""
+        parts = []
+        style = None
+        for cell in cells:
+            cell_style = cell[:-1]
+            if cell_style == style:
+                parts.append(cell[-1])
+            else:
+                parts.append(cell)
+                style = cell_style
+        parts.append(term.normal)
+        return ''.join(parts)
+
     # Multi-row ASCII clouds using ▓▒░ (2-3 rows, wide)
     def make_cloud_pattern(size):
         """Generate a cloud pattern. Size: 'small', 'medium', 'large'"""
@@ -132,24 +334,40 @@ def main():
                 (1, 2, '░'), (2, 2, '▒'), (3, 2, '▒'), (4, 2, '▓'), (5, 2, '▓'), (6, 2, '▒'), (7, 2, '▒'), (8, 2, '░'),
             ]
 
-    # Clouds with parallax - [x, y, speed, pattern, last_move_time, tint]
-    init_time = time.time()
+    def clip_cloud(cloud):
+        """Cache the cloud's visible cells with their finished cell strings."""
+        cx, cy = cloud.x, cloud.y
+        cell_color = sky_color + fg_rgb(*cloud.tint)
+        cloud.cells = [(cx + dx, cy + dy, cell_color + char)
+                       for dx, dy, char in cloud.pattern
+                       if area_x <= cx + dx < area_right and area_y <= cy + dy < sky_bottom]
+
+    # Clouds with parallax
+    init_ns = time.monotonic_ns()
+    # One generator instance for the whole scene; its bound methods skip the
+    # module-level wrappers around the shared global generator
+    rng = random.Random()
+    randint = rng.randint
     clouds = []
     num_clouds = max(4, area_w // 35)
     for i in range(num_clouds):
         # Parallax: row 0 = far/slow, row 1-2 = closer/faster
-        depth = random.randint(0, 2)
-        x = area_x + random.randint(0, area_w - 10)
+        depth = randint(0, 2)
+        x = area_x + randint(0, area_w - 10)
         y = area_y + depth
         # Speed based on depth
         base_speed = [1.4, 0.9, 0.6][depth]
-        speed = base_speed + random.random() * 0.3
+        speed = base_speed + rng.random() * 0.3
         # Size based on depth (far = small, close = large)
         size = ['small', 'medium', 'large'][depth]
         pattern = make_cloud_pattern(size)
         # Tint: far = hazier/darker, close = brighter
         tint = [(180, 190, 210), (220, 230, 245), (250, 252, 255)][depth]
-        clouds.append([x, y, speed, pattern, init_time + random.random() * 2, tint])
+        cloud = Cloud(x, y, int(speed * 1e9), pattern, init_ns + int(rng.random() * 2e9), tint)
+        clip_cloud(cloud)
+        clouds.append(cloud)
+    # Earliest time any cloud is due to move, kept current by update_clouds()
+    next_cloud_ns = min(cloud.last_move_ns + cloud.speed_ns for cloud in clouds)
 
     # Canopy color palettes (fg_color variations)
     canopy_palettes = [
@@ -167,11 +385,16 @@ def main():
         [((60, 40, 25), (40, 28, 16)), ((75, 50, 30), (55, 38, 22))],    # Reddish brown
     ]
 
+    # Palette indexing masks with & instead of %, so the sizes are fixed: four
+    # palettes of each kind, four canopy shades, two trunk shades
+    assert len(canopy_palettes) == 4 and all(len(pal) == 4 for pal in canopy_palettes)
+    assert len(trunk_palettes) == 4 and all(len(pal) == 2 for pal in trunk_palettes)
+
     def generate_tree(canopy_width, canopy_rows, trunk_width, trunk_height, canopy_palette_idx, trunk_palette_idx):
         """Generate a tree pattern with given parameters."""
         cells = []
-        canopy_pal = canopy_palettes[canopy_palette_idx % len(canopy_palettes)]
-        trunk_pal = trunk_palettes[trunk_palette_idx % len(trunk_palettes)]
+        canopy_pal = canopy_palettes[canopy_palette_idx & 3]
+        trunk_pal = trunk_palettes[trunk_palette_idx & 3]
 
         trunk_center = canopy_width // 2
 
@@ -195,19 +418,22 @@ def main():
                 elif dist_from_edge <= 2:
                     style = 1  # Medium (▒)
                 else:
-                    style = random.choice([0, 0, 3])  # Dense (▓)
+                    style = rng.choice((0, 0, 3))  # Dense (▓): 0 twice as often as 3
                 cells.append((x, dy, 'leaf', style, canopy_pal))
 
         # Generate trunk - from just under canopy down to grass
         # Canopy ends at dy = -(trunk_height + 1), trunk starts at -(trunk_height)
+        # Trunk styles (0 or 1) are drawn up front as one random integer, one bit per cell
         wave_offsets = [0, 1, 0, -1, -1, 0, 1, 1, 0, -1]
+        half_tw = trunk_width // 2
+        style_bits = rng.getrandbits((trunk_height + 2) * (2 * half_tw + 1))
         for i, dy in enumerate(range(-trunk_height, 2)):  # -trunk_height to 1 inclusive
             wave_idx = i % len(wave_offsets)
             offset = wave_offsets[wave_idx]
-            half_tw = trunk_width // 2
             for dx in range(-half_tw, half_tw + 1):
                 x = trunk_center + dx + offset
-                style = random.randint(0, 1)
+                style = style_bits & 1
+                style_bits >>= 1
                 cells.append((x, dy, 'trunk', style, trunk_pal))
 
         return cells
@@ -217,80 +443,82 @@ def main():
     x = 5
     while x < area_w - 25:
         # Randomize tree parameters
-        canopy_w = random.randint(14, 24)
-        canopy_rows = random.randint(2, 4)
-        trunk_w = random.randint(4, 7)
-        trunk_h = random.randint(3, 6)
-        canopy_pal = random.randint(0, len(canopy_palettes) - 1)
-        trunk_pal = random.randint(0, len(trunk_palettes) - 1)
-        grass_depth = random.randint(0, 2)  # 0=on ground, 1=in row 1, 2=in row 2
+        canopy_w = randint(14, 24)
+        canopy_rows = randint(2, 4)
+        trunk_w = randint(4, 7)
+        trunk_h = randint(3, 6)
+        canopy_pal = randint(0, len(canopy_palettes) - 1)
+        trunk_pal = randint(0, len(trunk_palettes) - 1)
+        grass_depth = randint(0, 2)  # 0=on ground, 1=in row 1, 2=in row 2
 
         cells = generate_tree(canopy_w, canopy_rows, trunk_w, trunk_h, canopy_pal, trunk_pal)
         trees.append((x, cells, grass_depth))
 
         # Random spacing
-        x += random.randint(25, 40)
+        x += randint(25, 40)
 
     # Store which cells are part of trees for redrawing
-    # tree_cells[(x,y)] = (cell_type, style_idx, palette)
-    tree_cells = {}
+    # The world byte says whether a cell holds a tree; tree_map (same flat,
+    # row-major layout) holds its render data: (cell_type, bg, seq) - bg is the
+    # cell's background (sky for leaves, see-through), seq the complete
+    # fg+bg+char cell string. Trees never change after generation, so both are
+    # built once here.
+    tree_map = [None] * (area_w * area_h)
+
+    def get_tree(gx, gy):
+        """Get tree cell data at grid position, None if there is no tree."""
+        row = gy - area_y
+        col = gx - area_x
+        if 0 <= row < area_h and 0 <= col < area_w:
+            idx = row * area_w + col
+            if world[idx] & TREE_MASK:
+                return tree_map[idx]
+        return None
 
     def init_trees():
         """Initialize tree cell data."""
+        chars = ['▓', '▒', '░', '▓']
         for base_x, cells, grass_depth in trees:
             for cell in cells:
                 dx, dy, cell_type, style_idx, palette = cell
                 x = area_x + base_x + dx
                 y = ground_y + dy + grass_depth - 1  # Shift up 1 tile
-                if area_x <= x < area_x + area_w and area_y <= y < area_y + area_h:
-                    tree_cells[(x, y)] = (cell_type, style_idx, palette)
+                if area_x <= x < area_right and area_y <= y < area_bottom:
+                    char = chars[style_idx & 3]
+                    if cell_type == 'leaf':
+                        # Leaf: green fg on sky bg
+                        color = palette[style_idx & 3]
+                        fg = fg_rgb(color[0], color[1], color[2])
+                        bg = sky_color
+                    else:
+                        # Trunk: brown fg on darker brown bg
+                        fg_color, bg_color = palette[style_idx & 1]
+                        fg = fg_rgb(fg_color[0], fg_color[1], fg_color[2])
+                        bg = bg_rgb(bg_color[0], bg_color[1], bg_color[2])
+                    idx = (y - area_y) * area_w + (x - area_x)
+                    kind = TREE_LEAF if cell_type == 'leaf' else TREE_TRUNK
+                    world[idx] = (world[idx] & TILE_MASK) | kind
+                    tree_map[idx] = (cell_type, bg, fg + bg + char)
 
     def draw_tree_cell(x, y, cell_data):
         """Draw a single tree cell."""
-        cell_type, style_idx, palette = cell_data
-        chars = ['▓', '▒', '░', '▓']
-        char = chars[style_idx % len(chars)]
-
-        if cell_type == 'leaf':
-            # Leaf: green fg on sky bg
-            color = palette[style_idx % len(palette)]
-            fg = term.color_rgb(color[0], color[1], color[2])
-            print(term.move_xy(x, y) + fg + sky_color + char, end='')
-        else:
-            # Trunk: brown fg on darker brown bg
-            fg_color, bg_color = palette[style_idx % len(palette)]
-            fg = term.color_rgb(fg_color[0], fg_color[1], fg_color[2])
-            bg = term.on_color_rgb(bg_color[0], bg_color[1], bg_color[2])
-            print(term.move_xy(x, y) + fg + bg + char, end='')
+        put(x, y, cell_data[2])
 
     def draw_trees():
         """Draw all trees."""
-        for (x, y), cell_data in tree_cells.items():
-            if area_x <= x < area_x + area_w:
-                draw_tree_cell(x, y, cell_data)
-        print('', end='', flush=True)
+        for idx, cell_data in enumerate(tree_map):
+            if cell_data:
+                row, col = divmod(idx, area_w)
+                draw_tree_cell(area_x + col, area_y + row, cell_data)
 
     def redraw_tree_at(x, y):
         """Redraw tree cell at position if there is one."""
-        if (x, y) in tree_cells:
-            draw_tree_cell(x, y, tree_cells[(x, y)])
-
-    def get_trunk_bg(cell_data):
-        """Get background color for trunk cell from its palette."""
-        _, style_idx, palette = cell_data
-        _, bg_color = palette[style_idx % len(palette)]
-        return term.on_color_rgb(bg_color[0], bg_color[1], bg_color[2])
-
-    def get_bg_at(x, y):
-        """Get the background color at a single position (tree, sky, dirt, or grass)."""
-        # Check if it's a tree cell
-        if (x, y) in tree_cells:
-            cell_data = tree_cells[(x, y)]
-            if cell_data[0] == 'leaf':
-                return sky_color  # Leaves have sky background (see-through effect)
-            else:
-                return get_trunk_bg(cell_data)
-        # Otherwise use terrain
+        cell_data = get_tree(x, y)
+        if cell_data:
+            draw_tree_cell(x, y, cell_data)
+
+    def get_terrain_bg(x, y):
+        """Get the terrain background color at a single position (sky, dirt, or grass)."""
         tile = get_tile(x, y)
         if tile == SKY:
             return sky_color
@@ -301,22 +529,26 @@ def main():
 
     def get_entity_bg(x, y, width=2):
         """Get background color for an entity spanning multiple cells.
-        If any cell is a tree, use tree color. Otherwise use terrain."""
-        # Check all positions the entity covers
-        for dx in range(width):
-            if (x + dx, y) in tree_cells:
-                cell_data = tree_cells[(x + dx, y)]
-                if cell_data[0] == 'leaf':
-                    return sky_color  # Leaves have sky background (see-through effect)
-                else:
-                    return get_trunk_bg(cell_data)
+        A trunk under any cell wins, then a leaf (sky bg, see-through), then terrain."""
+        row = y - area_y
+        over_leaf = False
+        if 0 <= row < area_h:
+            base = row * area_w - area_x  # base + gx is the cell's index
+            for gx in range(max(x, area_x), min(x + width, area_right)):
+                kind = world[base + gx] & TREE_MASK
+                if kind == TREE_TRUNK:
+                    return tree_map[base + gx][1]
+                over_leaf = over_leaf or kind == TREE_LEAF
+        if over_leaf:
+            return sky_color
         # No tree overlap, use terrain at starting position
-        return get_bg_at(x, y)
+        return get_terrain_bg(x, y)
 
     def redraw_cell(x, y):
         """Redraw a single cell - tree cell or terrain."""
-        if (x, y) in tree_cells:
-            draw_tree_cell(x, y, tree_cells[(x, y)])
+        cell_data = get_tree(x, y)
+        if cell_data:
+            draw_tree_cell(x, y, cell_data)
         else:
             draw_tile(x, y)
 
@@ -332,114 +564,121 @@ def main():
     num_butterflies = max(2, area_w // 40)
     butterflies = []
     for i in range(num_butterflies):
-        butterflies.append({
-            'x': area_x + (i + 1) * area_w // (num_butterflies + 1),
-            'y': area_y + 2 + (i % 3),
-            'last_move': init_time + i * 0.3,
-            'emoji': '🦋',
-            'speed': 0.8 + random.random() * 0.4
-        })
+        butterflies.append(Butterfly(
+            x=area_x + (i + 1) * area_w // (num_butterflies + 1),
+            y=fly_top + (i % 3),
+            last_move_ns=init_ns + i * 300_000_000,
+            speed_ns=int((0.8 + rng.random() * 0.4) * 1e9),
+        ))
+    # Earliest time any butterfly is due to move, kept current by update_butterflies()
+    next_butterfly_ns = min(b.last_move_ns + b.speed_ns for b in butterflies)
 
     def draw_butterflies():
         """Draw all butterflies."""
         for b in butterflies:
-            if area_x <= b['x'] < area_x + area_w - 1:
-                width = char_width(b['emoji'])
-                bg = get_entity_bg(b['x'], b['y'], width)
-                print(term.move_xy(b['x'], b['y']) + bg(b['emoji']), end='')
-        print('', end='', flush=True)
+            if area_x <= b.x < area_right - 1:
+                bg = get_entity_bg(b.x, b.y, b.width)
+                put(b.x, b.y, bg + b.emoji, b.width)
 
     def clear_butterfly(b):
         """Clear a butterfly position."""
-        width = char_width(b['emoji'])
-        redraw_cells(b['x'], b['y'], width)
+        redraw_cells(b.x, b.y, b.width)
 
-    def update_butterflies():
-        """Update butterflies - random movement with flicker on move."""
-        now = time.time()
+    def update_butterflies(now):
+        """Update butterflies - random movement. Returns at once if none is due."""
+        nonlocal next_butterfly_ns
+        if now < next_butterfly_ns:
+            return
 
         for b in butterflies:
-            if now - b['last_move'] >= b['speed']:
+            if now - b.last_move_ns >= b.speed_ns:
                 clear_butterfly(b)
-                print('', end='', flush=True)
 
                 # Random direction
-                dx = random.choice([-1, 0, 0, 1])
-                dy = random.choice([-1, 0, 0, 1])
+                dx = rng.choice([-1, 0, 0, 1])
+                dy = rng.choice([-1, 0, 0, 1])
 
-                new_x = b['x'] + dx
-                new_y = b['y'] + dy
+                new_x = b.x + dx
+                new_y = b.y + dy
 
                 # Constrain to rows 2-4 of sky and within bounds
-                if area_x <= new_x < area_x + area_w - 2:
-                    b['x'] = new_x
-                if area_y + 2 <= new_y <= area_y + 4:
-                    b['y'] = new_y
+                if area_x <= new_x < area_right - 2:
+                    b.x = new_x
+                if fly_top <= new_y <= fly_bottom:
+                    b.y = new_y
 
-                b['last_move'] = now
-                if area_x <= b['x'] < area_x + area_w - 1:
-                    width = char_width(b['emoji'])
-                    bg = get_entity_bg(b['x'], b['y'], width)
-                    print(term.move_xy(b['x'], b['y']) + bg(b['emoji']), end='', flush=True)
+                b.last_move_ns = now
+                if area_x <= b.x < area_right - 1:
+                    bg = get_entity_bg(b.x, b.y, b.width)
+                    put(b.x, b.y, bg + b.emoji, b.width)
+        next_butterfly_ns = min(b.last_move_ns + b.speed_ns for b in butterflies)
 
     def draw_clouds():
         """Draw all multi-cell clouds."""
         for cloud in clouds:
-            cx, cy, _, pattern, _, tint = cloud
-            cloud_color = term.color_rgb(tint[0], tint[1], tint[2])
-            for dx, dy, char in pattern:
-                px, py = cx + dx, cy + dy
-                if area_x <= px < area_x + area_w and area_y <= py < area_y + sky_rows:
-                    print(term.move_xy(px, py) + sky_color + cloud_color + char, end='')
+            for px, py, cell in cloud.cells:
+                put(px, py, cell)
 
     def clear_cloud(cloud):
         """Clear a cloud - redraw underlying cells."""
-        cx, cy, _, pattern, _, _ = cloud
-        for dx, dy, _ in pattern:
-            px, py = cx + dx, cy + dy
-            if area_x <= px < area_x + area_w and area_y <= py < area_y + sky_rows:
-                redraw_cell(px, py)
-
-    def update_clouds():
-        """Move clouds based on their speed using real time."""
-        now = time.time()
+        for px, py, _ in cloud.cells:
+            redraw_cell(px, py)
+
+    def update_clouds(now):
+        """Move clouds based on their speed using real time. Returns at once if none is due."""
+        nonlocal next_cloud_ns
+        if now < next_cloud_ns:
+            return
         any_moved = False
         for cloud in clouds:
-            last_move = cloud[4]
-            speed = cloud[2]
-            if now - last_move >= speed:
+            if now - cloud.last_move_ns >= cloud.speed_ns:
                 # Clear old position
                 clear_cloud(cloud)
-                # Move cloud
-                cloud[0] += 1
-                # Wrap around (clouds are wider now)
-                if cloud[0] >= area_x + area_w + 5:
-                    cloud[0] = area_x - 10
-                cloud[4] = now
+                # Move cloud, wrapping around (clouds are wider now)
+                x = cloud.x + 1
+                if x >= area_right + 5:
+                    x = area_x - 10
+                cloud.x = x
+                cloud.last_move_ns = now
+                clip_cloud(cloud)
                 any_moved = True
-        # Only redraw and flush if something moved
+        next_cloud_ns = min(cloud.last_move_ns + cloud.speed_ns for cloud in clouds)
+        # Only redraw if something moved
         if any_moved:
             draw_clouds()
-            print('', end='', flush=True)
 
-    def draw_tile(x, y):
-        """Draw a single tile."""
+    def tile_cell(x, y):
+        """Get the rendered cell string (colored space) for a tile, '' if out of bounds."""
         tile = get_tile(x, y)
         if tile == SKY:
-            print(term.move_xy(x, y) + sky_color(' '), end='')
+            return tile_cells[sky_color]
         elif tile == GRASS:
-            print(term.move_xy(x, y) + get_grass_color(x, y)(' '), end='')
+            return tile_cells[get_grass_color(x, y)]
         elif tile == DIRT:
-            print(term.move_xy(x, y) + get_dirt_color(x, y)(' '), end='')
+            return tile_cells[get_dirt_color(x, y)]
+        return ''
+
+    def draw_tile(x, y):
+        """Draw a single tile."""
+        cell = tile_cell(x, y)
+        if cell:
+            put(x, y, cell)
 
     def draw_player():
         """Draw the player."""
-        bg = get_entity_bg(player_x, player_y, width=2)
-        print(term.move_xy(player_x, player_y) + bg(player_char), end='', flush=True)
-
-    def clear_player():
-        """Clear player from current position."""
-        redraw_cells(player_x, player_y, width=2)
+        bg = get_entity_bg(player_x, player_y, PLAYER_WIDTH)
+        put(player_x, player_y, bg + player_char, PLAYER_WIDTH)
+
+    def move_player(new_x, new_y):
+        """Move the player, restoring only the cells it vacates. Newly dug tiles
+        under the new position need no repaint; the player covers them."""
+        nonlocal player_x, player_y
+        vacated = [(player_x + dx, player_y) for dx in range(PLAYER_WIDTH)
+                   if not (player_y == new_y and new_x <= player_x + dx < new_x + PLAYER_WIDTH)]
+        player_x, player_y = new_x, new_y
+        for x, y in vacated:
+            redraw_cell(x, y)
+        draw_player()
 
     def is_underground():
         """Check if player is below ground level (in the dirt/grass)."""
@@ -449,20 +688,20 @@ def main():
         """Check if player is standing on ground level."""
         return player_y == ground_y
 
-    with term.fullscreen(), term.cbreak(), term.hidden_cursor():
-        print(term.home + term.clear)
+    with term.fullscreen(), term.cbreak(), term.hidden_cursor(), frame_writer():
+        emit(term.home + term.clear)
 
         # Header
-        print(term.move_xy(0, 0) + term.bold_white_on_blue(
+        emit(move_xy(0, 0) + term.bold_white_on_blue(
             ' BLESSED DEMO - Dig & Jump! '.center(term.width)
         ))
 
         # Instructions at bottom - compact centered box
-        inst_y = area_y + area_h + 1
-        box_color = term.color_rgb(80, 60, 40)
-        accent_color = term.color_rgb(180, 140, 80)
-        key_color = term.color_rgb(255, 220, 120)
-        text_color = term.color_rgb(200, 200, 180)
+        inst_y = area_bottom + 1
+        box_color = fg_rgb(80, 60, 40)
+        accent_color = fg_rgb(180, 140, 80)
+        key_color = fg_rgb(255, 220, 120)
+        text_color = fg_rgb(200, 200, 180)
 
         content = (key_color + 'A/D' + text_color + ' Move  ' +
                    key_color + 'W' + text_color + ' Up  ' +
@@ -470,72 +709,90 @@ def main():
                    key_color + 'SPACE' + text_color + ' Jump  ' +
                    key_color + 'Q' + text_color + ' Quit')
 
-        box_inner = 46  # Content width
-        box_w = box_inner + 4
+        box_w = BOX_INNER + 4
         inst_x = (term.width - box_w) // 2
 
-        print(term.move_xy(inst_x, inst_y) + accent_color + '┌' + '─' * box_inner + '─┐')
-        print(term.move_xy(inst_x, inst_y + 1) + accent_color + '│ ' + content + '  ' + accent_color + '│')
-        print(term.move_xy(inst_x, inst_y + 2) + accent_color + '└' + '─' * box_inner + '─┘')
-
-        # Draw terrain
+        emit(move_xy(inst_x, inst_y) + accent_color + BOX_TOP)
+        emit(move_xy(inst_x, inst_y + 1) + accent_color + '│ ' + content + '  ' + accent_color + '│')
+        emit(move_xy(inst_x, inst_y + 2) + accent_color + BOX_BOTTOM)
+
+        # Draw terrain - every row is prerendered into one string (cursor move plus
+        # one SGR per same-color run, so the sky band is a single run per row) and
+        # the whole grid goes out as one join. Nothing is dug yet, so a row's cells
+        # only depend on whether it is sky or, for grass, on y & 3 (see
+        # get_grass_color); each distinct row body is built once. Painted
+        # directly, so the cells are recorded in front_buf for later diffs.
+        row_bodies = {}  # 'sky' or y & 3 -> (cells, rendered row body)
+        row_strings = []
         for row in range(area_h):
-            for col in range(area_w):
-                draw_tile(area_x + col, area_y + row)
+            y = area_y + row
+            key = 'sky' if row < sky_rows else y & 3
+            if key not in row_bodies:
+                cells = [tile_cell(area_x + col, y) for col in range(area_w)]
+                row_bodies[key] = (cells, join_cells(cells))
+            cells, body = row_bodies[key]
+            front_buf.update(((area_x + col, y), cell) for col, cell in enumerate(cells))
+            row_strings.append(move_xy(area_x, y) + body)
+        emit(''.join(row_strings))
 
         # Draw initial clouds, butterflies, and trees
         draw_clouds()
         draw_butterflies()
         draw_trees()
 
-        # Draw border
-        for row in range(area_h):
-            y = area_y + row
-            print(term.move_xy(area_x - 1, y) + term.on_white(' '), end='')
-            print(term.move_xy(area_x + area_w, y) + term.on_white(' '), end='')
-        print(term.move_xy(area_x - 1, area_y - 1) + term.on_white(' ' * (area_w + 2)), end='')
-        print(term.move_xy(area_x - 1, area_y + area_h) + term.on_white(' ' * (area_w + 2)), end='')
+        # Draw border - assembled once and written in a single print
+        edge = term.on_white(' ')
+        border_row = term.on_white(' ' * (area_w + 2))
+        emit(''.join(move_xy(area_x - 1, y) + edge + move_xy(area_right, y) + edge
+                     for y in range(area_y, area_bottom)) +
+             move_xy(area_x - 1, area_y - 1) + border_row +
+             move_xy(area_x - 1, area_bottom) + border_row)
 
         # Draw player
         draw_player()
+        present()
+        flush()
 
         # Game loop
         running = True
         last_jump_time = 0
 
         while running:
-            key = term.inkey(timeout=0.05)
+            # Block in inkey until a key arrives or the next cloud, butterfly or
+            # jump frame is due, instead of waking at a fixed 20 Hz
+            deadline = min(next_cloud_ns, next_butterfly_ns)
+            if jumping:
+                deadline = min(deadline, last_jump_time + (JUMP_FRAME_NS if jump_frame else 0))
+            key = term.inkey(timeout=max(0, deadline - time.monotonic_ns()) / 1e9)
 
-            # Update clouds and butterfly (runs on real time, independent of input)
-            update_clouds()
-            update_butterflies()
+            # Update clouds and butterfly (runs on real time, independent of input).
+            # One clock read serves the whole tick, jump animation included.
+            now = time.monotonic_ns()
+            update_clouds(now)
+            update_butterflies(now)
 
             # Handle jump animation
             if jumping:
-                now = time.time()
                 elapsed = now - last_jump_time
 
                 if jump_frame == 0 and elapsed > 0:
                     # Frame 1: Go up
-                    clear_player()
-                    player_y -= 1
-                    draw_player()
+                    move_player(player_x, player_y - 1)
                     jump_frame = 1
                     last_jump_time = now
-                elif jump_frame == 1 and elapsed > 0.15:
+                elif jump_frame == 1 and elapsed > JUMP_FRAME_NS:
                     # Frame 2: Stay up (just wait)
                     jump_frame = 2
                     last_jump_time = now
-                elif jump_frame == 2 and elapsed > 0.15:
+                elif jump_frame == 2 and elapsed > JUMP_FRAME_NS:
                     # Frame 3: Come back down
-                    clear_player()
-                    player_y = jump_start_y
-                    draw_player()
+                    move_player(player_x, jump_start_y)
                     jumping = False
                     jump_frame = 0
 
             if key:
-                if key.lower() == 'q':
+                k = key.name or key.lower()
+                if k in QUIT_KEYS:
                     running = False
 
                 elif key == ' ' and not jumping:
@@ -544,9 +801,9 @@ def main():
                         jumping = True
                         jump_frame = 0
                         jump_start_y = player_y
-                        last_jump_time = time.time()
+                        last_jump_time = time.monotonic_ns()
 
-                elif key.lower() == 'a' or key.name == 'KEY_LEFT':
+                elif k in LEFT_KEYS:
                     # Move left
                     if not jumping:
                         new_x = player_x - 1
@@ -554,64 +811,46 @@ def main():
                             target_tile = get_tile(new_x, player_y)
                             if target_tile == SKY or target_tile == DIRT:
                                 # Can move freely in sky or already-dug dirt
-                                clear_player()
-                                player_x = new_x
-                                draw_player()
+                                move_player(new_x, player_y)
                             elif target_tile == GRASS and is_underground():
                                 # Underground: dig into grass
-                                clear_player()
                                 set_tile(new_x, player_y, DIRT)
                                 set_tile(new_x + 1, player_y, DIRT)  # For emoji width
-                                player_x = new_x
-                                draw_tile(new_x, player_y)
-                                draw_tile(new_x + 1, player_y)
-                                draw_player()
+                                move_player(new_x, player_y)
 
-                elif key.lower() == 'd' or key.name == 'KEY_RIGHT':
+                elif k in RIGHT_KEYS:
                     # Move right
                     if not jumping:
                         new_x = player_x + 1
-                        if new_x + 1 < area_x + area_w:
+                        if new_x + 1 < area_right:
                             # Check tile at right edge of emoji
                             target_tile = get_tile(new_x + 1, player_y)
                             if target_tile == SKY or target_tile == DIRT:
-                                clear_player()
-                                player_x = new_x
-                                draw_player()
+                                move_player(new_x, player_y)
                             elif target_tile == GRASS and is_underground():
                                 # Underground: dig into grass
-                                clear_player()
                                 set_tile(new_x, player_y, DIRT)
                                 set_tile(new_x + 1, player_y, DIRT)
-                                player_x = new_x
-                                draw_tile(new_x, player_y)
-                                draw_tile(new_x + 1, player_y)
-                                draw_player()
+                                move_player(new_x, player_y)
 
-                elif key.lower() == 's' or key.name == 'KEY_DOWN':
+                elif k in DOWN_KEYS:
                     # Move down / dig
                     if not jumping:
                         new_y = player_y + 1
-                        if new_y < area_y + area_h:
+                        if new_y < area_bottom:
                             tile_below = get_tile(player_x, new_y)
                             tile_below2 = get_tile(player_x + 1, new_y)
 
                             if tile_below == GRASS or tile_below2 == GRASS:
                                 # Dig into grass
-                                clear_player()
                                 set_tile(player_x, new_y, DIRT)
                                 set_tile(player_x + 1, new_y, DIRT)
-                                draw_tile(player_x, new_y)
-                                draw_tile(player_x + 1, new_y)
-                                player_y = new_y
-                                draw_player()
+                                move_player(player_x, new_y)
                             elif tile_below == DIRT or tile_below == SKY:
                                 # Move into empty space
-                                clear_player()
-                                player_y = new_y
-                                draw_player()
+                                move_player(player_x, new_y)
 
-                elif key.lower() == 'w' or key.name == 'KEY_UP':
+                elif k in UP_KEYS:
                     # Move up - ONLY works underground, not on surface
                     if not jumping and is_underground():
                         new_y = player_y - 1
@@ -620,18 +859,17 @@ def main():
 
                         if tile_above == SKY or tile_above == DIRT:
                             # Move up into dug tunnel or back to surface
-                            clear_player()
-                            player_y = new_y
-                            draw_player()
+                            move_player(player_x, new_y)
                         elif tile_above == GRASS:
                             # Dig up through grass
-                            clear_player()
                             set_tile(player_x, new_y, DIRT)
                             set_tile(player_x + 1, new_y, DIRT)
-                            draw_tile(player_x, new_y)
-                            draw_tile(player_x + 1, new_y)
-                            player_y = new_y
-                            draw_player()
+                            move_player(player_x, new_y)
+
+            # Everything this tick (ambient motion and player moves) is diffed
+            # against the screen and goes out in a single write
+            present()
+            flush()
 
 if __name__ == '__main__':
     main()
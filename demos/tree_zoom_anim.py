@@ -2,51 +2,162 @@
 Tree zoom animation - cycles through small/med/large sizes.
 Creates a "parallax" or "approaching/receding" effect.
 """
+import io
 import sys
+import time
+from functools import lru_cache
 from pathlib import Path
 
-# Add parent directory to path so we can import from tree_frames
+# Add parent directory to path so we can import from frames
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
+import numpy as np
 from blessed import Terminal
-from tree_frames.w20_frames import FRAMES as FRAMES_SMALL
-from tree_frames.w58_frames import FRAMES as FRAMES_MED
-from tree_frames.w100_frames import FRAMES as FRAMES_LARGE
+from frames.tree.w20_frames import FRAMES as FRAMES_SMALL
+from frames.tree.w58_frames import FRAMES as FRAMES_MED
+from frames.tree.w100_frames import FRAMES as FRAMES_LARGE
+
+FRAME_TIME = 0.20  # Seconds per animation frame
+SPACE = ord(' ')
+
+# Synchronized output (DEC mode 2026): supporting terminals hold everything
+# between BSU and ESU so a frame appears at once; others ignore the sequences
+BSU = '\x1b[?2026h'
+ESU = '\x1b[?2026l'
+
+
+def ansi_move_xy(col, row):
+    """Cursor move (CUP) formatted directly, skipping blessed's terminfo lookup."""
+    return f'\x1b[{row + 1};{col + 1}H'
+
+
+class Sprite:
+    """A static (ASCII) frame reduced once to its non-space cells.
+
+    `rows`/`cols` index those cells and `chars` holds their byte codes, so
+    drawing is one vectorized scatter that never visits whitespace.
+    """
+
+    __slots__ = ('rows', 'cols', 'chars', 'height', 'width')
+
+    def __init__(self, frame):
+        lines = frame.split('\n')
+        self.height = len(lines)
+        self.width = max(len(line) for line in lines)
+        grid = np.array([list(line.ljust(self.width).encode('ascii')) for line in lines], dtype=np.uint8)
+        self.rows, self.cols = np.nonzero(grid != SPACE)
+        self.chars = grid[self.rows, self.cols]
 
 
 class Screen:
-    """Double-buffered screen with dirty tracking."""
+    """Double-buffered screen with dirty tracking.
+
+    Both buffers are (height, width) uint8 arrays of ASCII codes - one byte per
+    cell in one contiguous block - so clearing, sprite blits and the frame
+    diff each run as a single vectorized operation.
+    A parallel uint8 array holds each cell's style index into `styles`
+    (0 is the terminal default), so colored cells diff the same way. Until a
+    style is registered the style array is left alone entirely.
+    """
 
     def __init__(self, term):
         self.term = term
         self.width = term.width
         self.height = term.height - 1
-        self.current = [[' '] * self.width for _ in range(self.height)]
-        self.previous = [['X'] * self.width for _ in range(self.height)]  # Force initial draw
+        self.current = np.full((self.height, self.width), SPACE, dtype=np.uint8)
+        self.previous = np.zeros((self.height, self.width), dtype=np.uint8)  # Force initial draw
+        self.attrs = np.zeros((self.height, self.width), dtype=np.uint8)
+        self.previous_attrs = np.zeros((self.height, self.width), dtype=np.uint8)
+        self.styles = [term.normal]  # SGR sequence per style index
+        # Cursor-move sequences are formatted once per cell, on first use -
+        # directly if blessed's sequence for this terminal is the standard CUP
+        move_xy = ansi_move_xy if term.move_xy(7, 3) == ansi_move_xy(7, 3) else term.move_xy
+        self.move_xy = lru_cache(maxsize=None)(move_xy)
+
+    def add_style(self, fg=None, bg=None):
+        """Register a 256-color fg/bg pair and return its style index.
+
+        Foreground and background go out as one combined SGR sequence.
+        """
+        params = []
+        if fg is not None:
+            params.append(f'38;5;{fg}')
+        if bg is not None:
+            params.append(f'48;5;{bg}')
+        self.styles.append(f"\x1b[0;{';'.join(params)}m")
+        return len(self.styles) - 1
+
+    @property
+    def styled(self):
+        """True once any style beyond the default has been registered."""
+        return len(self.styles) > 1
 
     def clear(self):
         """Clear current buffer."""
-        for row in self.current:
-            for i in range(len(row)):
-                row[i] = ' '
-
-    def draw_sprite(self, lines, x, y):
-        """Draw sprite to current buffer (non-space chars only)."""
-        for i, line in enumerate(lines):
-            row = y + i
-            if 0 <= row < self.height:
-                for j, ch in enumerate(line):
-                    col = x + j
-                    if 0 <= col < self.width and ch != ' ':
-                        self.current[row][col] = ch
+        self.current.fill(SPACE)
+        if self.styled:
+            self.attrs.fill(0)
+
+    def draw_sprite(self, sprite, x, y, style=0):
+        """Draw a Sprite to current buffer (non-space chars only)."""
+        rows, cols, chars = sprite.rows + y, sprite.cols + x, sprite.chars
+
+        # Clip to the screen, unless the whole sprite is on it
+        if x < 0 or y < 0 or x + sprite.width > self.width or y + sprite.height > self.height:
+            inside = (rows >= 0) & (rows < self.height) & (cols >= 0) & (cols < self.width)
+            rows, cols, chars = rows[inside], cols[inside], chars[inside]
+
+        self.current[rows, cols] = chars
+        if self.styled:
+            self.attrs[rows, cols] = style
 
     def render(self, out):
-        """Output only changed characters."""
-        for row in range(self.height):
-            for col in range(self.width):
-                if self.current[row][col] != self.previous[row][col]:
-                    out(self.term.move_xy(col, row) + self.current[row][col])
-                    self.previous[row][col] = self.current[row][col]
+        """Output only changed characters, one cursor move per horizontal run.
+
+        An SGR sequence is written only where the style differs from the last
+        one emitted this frame, not once per run.
+        """
+        move_xy = self.move_xy
+        styles = self.styles
+        styled = self.styled
+        current, attrs = self.current, self.attrs
+        dirty = current != self.previous
+        if styled:
+            dirty |= attrs != self.previous_attrs
+        rows, cols = np.nonzero(dirty)
+        if not rows.size:
+            return
+
+        # A run breaks wherever the next dirty cell isn't the one directly to
+        # the right; a segment additionally breaks where the style changes
+        jumps = (np.diff(rows) != 0) | (np.diff(cols) != 1)
+        if styled:
+            cell_attrs = attrs[rows, cols]
+            breaks = np.flatnonzero(jumps | (np.diff(cell_attrs) != 0)) + 1
+        else:
+            breaks = np.flatnonzero(jumps) + 1
+        starts = np.concatenate(([0], breaks))
+        ends = np.concatenate((breaks, [rows.size])).tolist()
+        moves = np.concatenate(([True], jumps[breaks - 1])).tolist()
+        seg_attrs = cell_attrs[starts].tolist() if styled else [0] * len(ends)
+        rows, cols = rows.tolist(), cols.tolist()
+
+        parts = []
+        last_attr = 0
+        for start, end, move, attr in zip(starts.tolist(), ends, moves, seg_attrs):
+            row, col = rows[start], cols[start]
+            if move:
+                parts.append(move_xy(col, row))
+            if attr != last_attr:
+                parts.append(styles[attr])
+                last_attr = attr
+            parts.append(current[row, col:cols[end - 1] + 1].tobytes().decode('ascii'))
+        if last_attr:
+            parts.append(styles[0])
+        out(''.join(parts))
+        self.previous[:] = current
+        if styled:
+            self.previous_attrs[:] = attrs
 
 
 def get_frame_sets():
@@ -63,6 +174,16 @@ def get_frame_sets():
 
 
 def main():
+    # Give stdout a 64 KiB buffer with no line buffering, so a frame only leaves
+    # on the explicit flush() instead of in fragments. Only the frame output
+    # goes through it: blessed writes its own sequences (fullscreen, cursor) to
+    # sys.__stdout__ and flushes each one, and every frame is flushed before
+    # the next of those, so the two never interleave. Terminal(stream=...) is
+    # not an option - blessed only reads the keyboard for its default stream.
+    sys.stdout.flush()
+    raw = getattr(sys.stdout.buffer, 'raw', sys.stdout.buffer)
+    sys.stdout = io.TextIOWrapper(io.BufferedWriter(raw, buffer_size=1 << 16),
+                                  encoding='utf-8', line_buffering=False)
     term = Terminal()
     out = sys.stdout.write
     flush = sys.stdout.flush
@@ -74,7 +195,19 @@ def main():
     set_idx = 0  # Which size we're on (0=small, 1=med, 2=large, 3=med)
     frame_idx = 0  # Which frame within the current size
 
-    current_frames, current_label = frame_sets[set_idx]
+    current_frames = frame_sets[set_idx][0]
+
+    # Each frame reduced to a Sprite once: sprites[set_idx][frame_idx]
+    sprites = [[Sprite(frame) for frame in frames] for frames, _ in frame_sets]
+
+    # Status line for every (size, frame), positioned and padded once
+    status_y = term.height - 1
+    status_lines = [
+        [term.move_xy(0, status_y) +
+         f"Size: {label:8} | Frame: {i + 1}/{len(frames)} | 'q' to quit".ljust(term.width)
+         for i in range(len(frames))]
+        for frames, label in frame_sets
+    ]
 
     with term.fullscreen(), term.cbreak(), term.hidden_cursor():
         out(term.home + term.clear)
@@ -82,29 +215,35 @@ def main():
 
         screen = Screen(term)
 
+        next_frame = time.monotonic()
         while True:
             screen.clear()
 
             # Get current frame
-            frame_lines = current_frames[frame_idx].split('\n')
+            sprite = sprites[set_idx][frame_idx]
 
             # Center horizontally, align to bottom
-            frame_width = max(len(line) for line in frame_lines)
-            x = (term.width - frame_width) // 2
-            y = screen.height - len(frame_lines)
+            x = (term.width - sprite.width) // 2
+            y = screen.height - sprite.height
 
-            screen.draw_sprite(frame_lines, x, y)
+            screen.draw_sprite(sprite, x, y)
+            out(BSU)
             screen.render(out)
 
             # Show status
-            out(term.move_xy(0, term.height - 1) +
-                f"Size: {current_label:8} | Frame: {frame_idx + 1}/{len(current_frames)} | 'q' to quit".ljust(term.width))
+            out(status_lines[set_idx][frame_idx] + ESU)
             flush()
 
-            # Input handling
-            key = term.inkey(timeout=0.20)
-            if key.lower() == 'q':
-                break
+            # Pace on a monotonic deadline: stray keys don't speed up the
+            # animation, and a backlog (slow terminal) is dropped, not replayed.
+            # Input is polled at least once per frame, even after an overrun.
+            next_frame = max(next_frame + FRAME_TIME, time.monotonic())
+            while True:
+                remaining = max(next_frame - time.monotonic(), 0)
+                if term.inkey(timeout=remaining).lower() == 'q':
+                    return
+                if next_frame <= time.monotonic():
+                    break
 
             # Advance frame
             frame_idx += 1
@@ -113,7 +252,7 @@ def main():
             if frame_idx >= len(current_frames):
                 frame_idx = 0
                 set_idx = (set_idx + 1) % len(frame_sets)
-                current_frames, current_label = frame_sets[set_idx]
+                current_frames = frame_sets[set_idx][0]
 
 
 if __name__ == "__main__":
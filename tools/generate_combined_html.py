@@ -1,6 +1,8 @@
 #!/usr/bin/env python3
 """Generate HTML file with combined bunny + scrolling tree animation."""
 
+import base64
+import re
 import sys
 from pathlib import Path
 import json
@@ -76,6 +78,33 @@ _BUNNY_FRAMES_OLD = [
                                    """,
 ]
 
+
+def pack_sprites(frames):
+    """Pack frames for the page as one base64 blob, whitespace left out.
+
+    Per frame: width and height bytes, then per row a run count followed by
+    (skip, length, char codes...) for each run of non-space characters. Frames
+    must be ASCII and at most 255 cells in each dimension.
+    """
+    packed = bytearray()
+    for frame in frames:
+        lines = frame.split('\n')
+        packed += bytes([max(len(line) for line in lines), len(lines)])
+        for line in lines:
+            runs = list(re.finditer(r'[^ ]+', line))
+            packed.append(len(runs))
+            end = 0
+            for run in runs:
+                packed += bytes([run.start() - end, len(run.group())]) + run.group().encode('ascii')
+                end = run.end()
+    return base64.b64encode(packed).decode('ascii')
+
+
+def to_js(value):
+    """Serialize for embedding in the page - compact, no spaces after separators."""
+    return json.dumps(value, separators=(',', ':'))
+
+
 html = f'''<!DOCTYPE html>
 <html lang="en">
 <head>
@@ -115,9 +144,11 @@ html = f'''<!DOCTYPE html>
     <div id="info">Bunny Scroller | 'r' to reset</div>
 
     <script>
-const TREE_FRAMES = {json.dumps(TREE_FRAMES)};
-const BUNNY_FRAMES_LEFT = {json.dumps(BUNNY_FRAMES_LEFT)};
-const BUNNY_FRAMES_RIGHT = {json.dumps(BUNNY_FRAMES_RIGHT)};
+// Frames arrive packed by the generator (see pack_sprites): base64 holding only
+// the runs of non-space characters, decoded once below
+const TREE_PACKED = {to_js(pack_sprites(TREE_FRAMES))};
+const BUNNY_PACKED_LEFT = {to_js(pack_sprites(BUNNY_FRAMES_LEFT))};
+const BUNNY_PACKED_RIGHT = {to_js(pack_sprites(BUNNY_FRAMES_RIGHT))};
 
 const screenEl = document.getElementById('screen');
 
@@ -146,6 +177,8 @@ window.addEventListener('resize', () => {{
     const vh = document.documentElement.clientHeight;
     WIDTH = Math.floor(vw / charW);
     HEIGHT = Math.floor(vh / charH);
+    groundCache = [];
+    buffer = null;  // Cells moved even if the count did not; start from a blank buffer
 }});
 
 console.log('viewport:', vw, 'x', vh, 'charSize:', charW, 'x', charH, 'buffer:', WIDTH, 'x', HEIGHT);
@@ -159,30 +192,106 @@ let treeX = -60; // Character position (not pixels)
 const TREE_SPEED = 2.5; // Characters per frame
 const TREE_ANIM_RATE = 3;
 
-// Create empty buffer
+const SPACE = 32;
+
+// Create empty buffer - one flat row-major array of char codes, not a row of
+// one-char strings per cell
 function createBuffer() {{
-    return Array.from({{ length: HEIGHT }}, () => Array(WIDTH).fill(' '));
+    return new Uint16Array(HEIGHT * WIDTH).fill(SPACE);
 }}
 
-// Draw sprite to buffer (only non-space chars)
-function drawSprite(buffer, lines, x, y) {{
-    for (let i = 0; i < lines.length; i++) {{
-        const row = y + i;
-        if (row >= 0 && row < HEIGHT) {{
-            for (let j = 0; j < lines[i].length; j++) {{
-                const col = x + j;
-                const ch = lines[i][j];
-                if (col >= 0 && col < WIDTH && ch !== ' ') {{
-                    buffer[row][col] = ch;
-                }}
+// The back buffer persists between frames; only the rectangles sprites covered
+// last frame are blanked, and it is reallocated only when the size changes
+let buffer = null;
+let spriteRects = [];
+
+function eraseRect(x, y, w, h) {{
+    const left = Math.max(x, 0);
+    const right = Math.min(x + w, WIDTH);
+    if (left >= right) return;
+    const bottom = Math.min(y + h, HEIGHT);
+    for (let row = Math.max(y, 0); row < bottom; row++) {{
+        buffer.fill(SPACE, row * WIDTH + left, row * WIDTH + right);
+    }}
+}}
+
+// Decode packed frames into sprites whose non-space cells are (row, col,
+// charCode) triples - done once at load, so drawing never visits whitespace
+function unpackSprites(packed) {{
+    const bytes = Uint8Array.from(atob(packed), ch => ch.charCodeAt(0));
+    const sprites = [];
+    let i = 0;
+    while (i < bytes.length) {{
+        const width = bytes[i++];
+        const height = bytes[i++];
+        const cells = [];
+        for (let row = 0; row < height; row++) {{
+            let col = 0;
+            for (let runs = bytes[i++]; runs > 0; runs--) {{
+                col += bytes[i++];
+                for (let len = bytes[i++]; len > 0; len--) cells.push(row, col++, bytes[i++]);
             }}
         }}
+        sprites.push({{ width, height, cells: Int32Array.from(cells) }});
     }}
+    return sprites;
 }}
 
-// Render buffer to string
+const TREE_SPRITES = unpackSprites(TREE_PACKED);
+const BUNNY_SPRITES_LEFT = unpackSprites(BUNNY_PACKED_LEFT);
+const BUNNY_SPRITES_RIGHT = unpackSprites(BUNNY_PACKED_RIGHT);
+
+// Draw sprite to buffer (only non-space chars)
+function drawSprite(buffer, sprite, x, y) {{
+    const cells = sprite.cells;
+    for (let i = 0; i < cells.length; i += 3) {{
+        const row = y + cells[i];
+        const col = x + cells[i + 1];
+        if (row >= 0 && row < HEIGHT && col >= 0 && col < WIDTH) {{
+            buffer[row * WIDTH + col] = cells[i + 2];
+        }}
+    }}
+}}
+
+// The screen is one text node per row; only rows whose cells changed since the
+// last frame get new text, so the browser re-lays out just those lines
+let rowNodes = [];
+let prevBuffer = null;
+
+// (Re)build the row nodes - at startup and whenever the buffer size changes
+function resetRows() {{
+    screenEl.textContent = '';
+    rowNodes = [];
+    for (let r = 0; r < HEIGHT; r++) {{
+        rowNodes.push(screenEl.appendChild(document.createTextNode('')));
+    }}
+    prevBuffer = null;
+}}
+
+function rowChanged(buffer, start, end) {{
+    for (let i = start; i < end; i++) {{
+        if (buffer[i] !== prevBuffer[i]) return true;
+    }}
+    return false;
+}}
+
+// Render buffer to screen, touching only dirty rows
 function renderBuffer(buffer) {{
-    return buffer.map(row => row.join('')).join('\\n');
+    if (rowNodes.length !== HEIGHT || !prevBuffer || prevBuffer.length !== buffer.length) {{
+        resetRows();
+    }}
+    for (let r = 0; r < HEIGHT; r++) {{
+        const start = r * WIDTH;
+        const end = start + WIDTH;
+        if (prevBuffer && !rowChanged(buffer, start, end)) continue;
+        const text = String.fromCharCode.apply(null, buffer.subarray(start, end));
+        rowNodes[r].data = r < HEIGHT - 1 ? text + '\\n' : text;
+    }}
+    if (prevBuffer) {{
+        prevBuffer.set(buffer);
+    }} else {{
+        prevBuffer = buffer.slice();
+    }}
 }}
 
 // Static ground pattern (repeating tile)
@@ -195,45 +304,70 @@ const GROUND_TILE = [
     "   . .     .  +    .   . .    .  .     . +     . .   +   .  ",
 ];
 
-// Draw ground layer across full width (scrolls with tree)
-function drawGround(buffer, offsetX) {{
-    const tileWidth = GROUND_TILE[0].length;
-    for (let i = 0; i < GROUND_TILE.length; i++) {{
-        const row = HEIGHT - GROUND_TILE.length + i;
-        if (row >= 0 && row < HEIGHT) {{
+const GROUND_TILE_WIDTH = GROUND_TILE[0].length;
+
+// Screen-wide ground rows (char codes) for each of the GROUND_TILE_WIDTH
+// possible scroll shifts, built on first use; cleared when WIDTH changes
+let groundCache = [];
+
+function groundRows(shift) {{
+    if (!groundCache[shift]) {{
+        groundCache[shift] = GROUND_TILE.map(tileRow => {{
+            const row = new Uint16Array(WIDTH);
             for (let col = 0; col < WIDTH; col++) {{
-                const srcCol = ((col - Math.floor(offsetX)) % tileWidth + tileWidth) % tileWidth;
-                const ch = GROUND_TILE[i][srcCol];
-                if (ch !== ' ') {{
-                    buffer[row][col] = ch;
-                }}
+                row[col] = tileRow.charCodeAt(((col - shift) % GROUND_TILE_WIDTH + GROUND_TILE_WIDTH) % GROUND_TILE_WIDTH);
             }}
+            return row;
+        }});
+    }}
+    return groundCache[shift];
+}}
+
+// Draw ground layer across full width (scrolls with tree). It is the first
+// layer drawn, so whole rows are copied, spaces included - this also wipes
+// whatever the ground band held last frame.
+function drawGround(buffer, offsetX) {{
+    const shift = (Math.floor(offsetX) % GROUND_TILE_WIDTH + GROUND_TILE_WIDTH) % GROUND_TILE_WIDTH;
+    const rows = groundRows(shift);
+    for (let i = 0; i < rows.length; i++) {{
+        const row = HEIGHT - rows.length + i;
+        if (row >= 0 && row < HEIGHT) {{
+            buffer.set(rows[i], row * WIDTH);
         }}
     }}
 }}
 
 function animate() {{
-    // Create fresh buffer
-    const buffer = createBuffer();
+    // Reuse the back buffer, blanking only where sprites were drawn last frame
+    if (!buffer || buffer.length !== HEIGHT * WIDTH) {{
+        buffer = createBuffer();
+    }} else {{
+        for (const [x, y, w, h] of spriteRects) eraseRect(x, y, w, h);
+    }}
 
     // Draw ground first (background) - scrolls with tree
     drawGround(buffer, treeX);
 
     // Get current frames
-    const treeLines = TREE_FRAMES[treeFrameIdx].split('\\n');
-    const bunnyFrames = bunnyFacingRight ? BUNNY_FRAMES_RIGHT : BUNNY_FRAMES_LEFT;
-    const bunnyLines = bunnyFrames[bunnyFrameIdx].split('\\n');
+    const tree = TREE_SPRITES[treeFrameIdx];
+    const bunnySprites = bunnyFacingRight ? BUNNY_SPRITES_RIGHT : BUNNY_SPRITES_LEFT;
+    const bunny = bunnySprites[bunnyFrameIdx];
 
     // Draw tree (middle layer)
-    const treeY = HEIGHT - treeLines.length;
-    drawSprite(buffer, treeLines, Math.floor(treeX), treeY);
+    const treeY = HEIGHT - tree.height;
+    drawSprite(buffer, tree, Math.floor(treeX), treeY);
 
     // Draw bunny (foreground layer)
-    const bunnyY = HEIGHT - bunnyLines.length;
-    drawSprite(buffer, bunnyLines, bunnyX, bunnyY);
+    const bunnyY = HEIGHT - bunny.height;
+    drawSprite(buffer, bunny, bunnyX, bunnyY);
+
+    spriteRects = [
+        [Math.floor(treeX), treeY, tree.width, tree.height],
+        [bunnyX, bunnyY, bunny.width, bunny.height],
+    ];
 
     // Render to screen
-    screenEl.textContent = renderBuffer(buffer);
+    renderBuffer(buffer);
 
     // Update tree position based on bunny direction
     if (bunnyFacingRight) {{
@@ -253,8 +387,8 @@ function animate() {{
     if (treeAnimTick >= TREE_ANIM_RATE) {{
         treeAnimTick = 0;
         treeFrameIdx += treeDirection;
-        if (treeFrameIdx >= TREE_FRAMES.length) {{
-            treeFrameIdx = TREE_FRAMES.length - 2;
+        if (treeFrameIdx >= TREE_SPRITES.length) {{
+            treeFrameIdx = TREE_SPRITES.length - 2;
             treeDirection = -1;
         }} else if (treeFrameIdx < 0) {{
             treeFrameIdx = 1;
@@ -263,7 +397,7 @@ function animate() {{
     }}
 
     // Update bunny animation
-    bunnyFrameIdx = (bunnyFrameIdx + 1) % BUNNY_FRAMES_LEFT.length;
+    bunnyFrameIdx = (bunnyFrameIdx + 1) % BUNNY_SPRITES_LEFT.length;
 }}
 
 // Keyboard controls
@@ -277,9 +411,20 @@ document.addEventListener('keydown', (e) => {{
     }}
 }});
 
-// Run at ~10 FPS (100ms)
-setInterval(animate, 100);
+// Run at ~10 FPS (100ms), paced by requestAnimationFrame so ticks line up with
+// the compositor and stop while the tab is hidden
+const FRAME_MS = 100;
+let lastTick = performance.now();
+
+function tick(now) {{
+    requestAnimationFrame(tick);
+    if (document.hidden || now - lastTick < FRAME_MS) return;
+    lastTick = now - (now - lastTick) % FRAME_MS;
+    animate();
+}}
+
 animate();
+requestAnimationFrame(tick);
     </script>
 </body>
 </html>'''
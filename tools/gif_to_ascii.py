@@ -55,12 +55,22 @@ Character Gradient:
 """
 
 import argparse
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import ExitStack, contextmanager
+from functools import lru_cache, partial
+import os
 from pathlib import Path
-from PIL import Image, ImageEnhance, ImageOps
+import sys
+import time
+from PIL import Image, ImageEnhance, ImageOps, ImageSequence, ImageStat
 import cv2
 import numpy as np
 
 
+# Seconds between progress line updates while converting
+PROGRESS_INTERVAL = 0.1
+
+
 # =============================================================================
 # CHARACTER GRADIENTS
 # =============================================================================
@@ -74,10 +84,53 @@ GRADIENTS = {
 }
 
 
+@lru_cache(maxsize=None)
+def gradient_lut(chars, space_density=1):
+    """
+    Build a 256-entry lookup table mapping each 8-bit brightness to its character.
+
+    Args:
+        chars: Gradient characters (light to dark)
+        space_density: Repeat spaces this many times (for wider spacing)
+
+    Returns:
+        NumPy string array indexed directly by pixel value
+    """
+    # pixel=0 (black) -> first char (lightest, usually space)
+    # pixel=255 (white) -> last char (darkest, usually #)
+    # Note: This assumes inverted images where dark=background
+    # (pixel * n) // 256 is int(pixel / 256 * n) in integer math, always < n
+    n = len(chars)
+    lut = []
+    for pixel in range(256):
+        char = chars[pixel * n // 256]
+        if char == ' ' and space_density > 1:
+            char = ' ' * space_density
+        lut.append(char)
+    return np.array(lut)
+
+
+@lru_cache(maxsize=None)
+def gradient_byte_lut(chars):
+    """
+    Byte-code version of gradient_lut for ASCII gradients (no space doubling).
+
+    Args:
+        chars: Gradient characters (light to dark), all ASCII
+
+    Returns:
+        256-byte translation table for bytes.translate, indexed by pixel value
+    """
+    return ''.join(gradient_lut(chars)).encode('ascii')
+
+
 # =============================================================================
 # IMAGE PROCESSING
 # =============================================================================
 
+# Every 8-bit value once, for building per-value lookup tables with PIL's own ops
+_RAMP = Image.frombytes("L", (256, 1), bytes(range(256)))
+
 def adjust_image(img, brightness=1.0, contrast=2.0, saturation=1.0, invert=False):
     """
     Apply image adjustments before ASCII conversion.
@@ -94,15 +147,82 @@ def adjust_image(img, brightness=1.0, contrast=2.0, saturation=1.0, invert=False
     """
     if saturation != 1.0:
         img = ImageEnhance.Color(img).enhance(saturation)
+
+    if img.mode not in ("RGB", "L"):
+        # Alpha-aware enhancement: leave these modes to PIL step by step
+        if brightness != 1.0:
+            img = ImageEnhance.Brightness(img).enhance(brightness)
+        if contrast != 1.0:
+            img = ImageEnhance.Contrast(img).enhance(contrast)
+        if invert:
+            img = ImageOps.invert(img.convert("RGB"))
+        return img
+
+    # Brightness, contrast and invert each map every channel value on its own,
+    # so they compose into one 256-entry table applied in a single pass. The
+    # table is built by running the same PIL operations on a 0-255 ramp, which
+    # keeps the result identical to applying them one after another.
+    ramp = _RAMP
     if brightness != 1.0:
-        img = ImageEnhance.Brightness(img).enhance(brightness)
+        ramp = ImageEnhance.Brightness(ramp).enhance(brightness)
     if contrast != 1.0:
-        img = ImageEnhance.Contrast(img).enhance(contrast)
+        # Contrast pivots on the mean luminance of the image as it is by now,
+        # rounded the same way ImageEnhance.Contrast computes it
+        pivot = img if brightness == 1.0 else img.point(list(ramp.tobytes()) * len(img.getbands()))
+        mean = int(ImageStat.Stat(pivot.convert("L")).mean[0] + 0.5)
+        ramp = Image.blend(Image.new("L", ramp.size, mean), ramp, contrast)
     if invert:
         # Invert colors - useful when source has light background
         # but you want dark background (spaces) in ASCII output
-        img = ImageOps.invert(img.convert("RGB"))
-    return img
+        ramp = ImageOps.invert(ramp)
+        img = img.convert("RGB")
+
+    if ramp is _RAMP:
+        return img
+    return img.point(list(ramp.tobytes()) * len(img.getbands()))
+
+
+def prepare_frame(frame, brightness=1.0, contrast=2.0, flip=False, invert=False):
+    """
+    Get a frame ready for conversion at any width.
+
+    Args:
+        frame: PIL Image
+        brightness: Brightness adjustment (1.0 = no change)
+        contrast: Contrast adjustment (2.0 = asciiart.eu default)
+        flip: If True, flip horizontally
+        invert: If True, invert colors (for light backgrounds)
+
+    Returns:
+        Adjusted PIL Image, still at full resolution and in color
+    """
+    # Apply image adjustments
+    adjusted = adjust_image(
+        frame,
+        brightness=brightness,
+        contrast=contrast,
+        invert=invert
+    )
+
+    # Flip horizontally if requested (for left/right variants)
+    if flip:
+        adjusted = ImageOps.mirror(adjusted)
+
+    # Grayscale conversion is left until after each resize: converting first
+    # lets LANCZOS overshoot clip differently and changes up to ~1.5% of
+    # characters on sharp-edged frames at small widths
+    return adjusted
+
+
+def ascii_size(img, width):
+    """
+    Output size in characters for an image at the given width.
+
+    ASCII chars are roughly 2x taller than wide, so the height is halved
+    to maintain the aspect ratio.
+    """
+    aspect_ratio = img.height / img.width
+    return width, int(width * aspect_ratio * 0.5)
 
 
 def image_to_ascii(img, width=58, gradient="minimalist", space_density=1):
@@ -110,7 +230,7 @@ def image_to_ascii(img, width=58, gradient="minimalist", space_density=1):
     Convert a PIL Image to ASCII art string.
 
     Args:
-        img: PIL Image to convert
+        img: PIL Image to convert (grayscale "L" images skip the conversion)
         width: Output width in characters
         gradient: Name of gradient from GRADIENTS dict, or custom string
         space_density: Repeat spaces this many times (for wider spacing)
@@ -118,52 +238,119 @@ def image_to_ascii(img, width=58, gradient="minimalist", space_density=1):
     Returns:
         ASCII art as a multi-line string
     """
-    # Get gradient characters (light to dark)
-    chars = GRADIENTS.get(gradient, gradient)
+    # Resize image to target dimensions
+    img = img.resize(ascii_size(img, width), Image.Resampling.LANCZOS)
+    return pixels_to_ascii(img, gradient=gradient, space_density=space_density)
 
-    # Calculate height - ASCII chars are roughly 2x taller than wide,
-    # so we halve the height to maintain aspect ratio
-    aspect_ratio = img.height / img.width
-    height = int(width * aspect_ratio * 0.5)
 
-    # Resize image to target dimensions
-    img = img.resize((width, height), Image.Resampling.LANCZOS)
+def frame_to_ascii(img, widths, gradient="minimalist", space_density=1):
+    """
+    Convert a PIL Image to ASCII art at several widths.
+
+    Every width is resized straight from the full-resolution image, so each
+    result matches image_to_ascii at that width exactly. (Chaining the
+    resizes, each from the previous smaller result, is cheaper but resamples
+    twice and changes around 2% of characters at small widths.)
+
+    Args:
+        img: PIL Image to convert
+        widths: Output widths in characters
+        gradient: Name of gradient from GRADIENTS dict, or custom string
+        space_density: Repeat spaces this many times (for wider spacing)
+
+    Returns:
+        Dict mapping each width to its ASCII art string
+    """
+    return {
+        width: image_to_ascii(img, width=width, gradient=gradient, space_density=space_density)
+        for width in dict.fromkeys(widths)
+    }
+
+
+def convert_frame(frame, widths, gradient="minimalist", brightness=1.0,
+                  contrast=2.0, flip=False, invert=False):
+    """
+    Prepare a frame and convert it to ASCII art at several widths.
+
+    One worker task per frame: the full-resolution frame goes in and only the
+    ASCII strings come back, so intermediate images never cross processes.
+
+    Args:
+        frame: PIL Image
+        widths: Output widths in characters
+        gradient: Name of gradient from GRADIENTS dict, or custom string
+        brightness: Brightness adjustment (1.0 = no change)
+        contrast: Contrast adjustment (2.0 = asciiart.eu default)
+        flip: If True, flip horizontally
+        invert: If True, invert colors (for light backgrounds)
+
+    Returns:
+        Dict mapping each width to its ASCII art string
+    """
+    prepared = prepare_frame(frame, brightness=brightness, contrast=contrast,
+                             flip=flip, invert=invert)
+    return frame_to_ascii(prepared, widths, gradient=gradient)
+
+
+def pixels_to_ascii(img, gradient="minimalist", space_density=1):
+    """
+    Convert an image already at its output size, one character per pixel.
+
+    Args:
+        img: PIL Image (grayscale "L" images skip the conversion)
+        gradient: Name of gradient from GRADIENTS dict, or custom string
+        space_density: Repeat spaces this many times (for wider spacing)
+
+    Returns:
+        ASCII art as a multi-line string
+    """
+    # Get gradient characters (light to dark)
+    chars = GRADIENTS.get(gradient, gradient)
 
     # Convert to grayscale (L = luminance)
-    img = img.convert("L")
-
-    # Get pixel values as flat list
-    pixels = list(img.getdata())
-
-    # Map each pixel brightness (0-255) to a character
-    ascii_chars = []
-    for pixel in pixels:
-        # Map 0-255 to gradient index
-        # pixel=0 (black) -> first char (lightest, usually space)
-        # pixel=255 (white) -> last char (darkest, usually #)
-        # Note: This assumes inverted images where dark=background
-        idx = int(pixel / 256 * len(chars))
-        idx = min(idx, len(chars) - 1)
-        char = chars[idx]
-
-        # Optional: repeat spaces for different density
-        if char == ' ' and space_density > 1:
-            char = ' ' * space_density
-        ascii_chars.append(char)
+    if img.mode != "L":
+        img = img.convert("L")
+
+    if space_density == 1 and chars.isascii():
+        # One byte per character: translate the raw pixel bytes through the
+        # table in one C-level pass, then cut them into lines
+        width = img.width
+        raw = img.tobytes().translate(gradient_byte_lut(chars))
+        return b'\n'.join([raw[i:i + width] for i in range(0, len(raw), width)]).decode('ascii')
 
-    # Split into lines based on width
-    lines = []
-    for i in range(0, len(ascii_chars), width):
-        line = ''.join(ascii_chars[i:i + width])
-        lines.append(line)
+    # Pixel brightness (0-255) as a (height, width) array
+    pixels = np.asarray(img, dtype=np.uint8)
 
-    return '\n'.join(lines)
+    # Map every pixel to its character with one table lookup, then join each
+    # row into a line
+    lut = gradient_lut(chars, space_density)
+    return '\n'.join(''.join(row) for row in np.take(lut, pixels).tolist())
 
 
 # =============================================================================
 # FRAME EXTRACTION
 # =============================================================================
 
+def composite_on_white(frame):
+    """
+    Flatten a GIF frame onto a white background.
+
+    Args:
+        frame: PIL Image (any mode)
+
+    Returns:
+        PIL Image (RGB)
+    """
+    # Convert to RGBA to handle transparency
+    frame = frame.convert("RGBA")
+
+    # Paste onto white through the frame's own alpha (transparent -> white):
+    # one masked copy straight into a new RGB image
+    flattened = Image.new("RGB", frame.size, (255, 255, 255))
+    flattened.paste(frame, mask=frame)
+    return flattened
+
+
 def extract_gif_frames(gif_path):
     """
     Extract all frames from an animated GIF.
@@ -175,29 +362,49 @@ def extract_gif_frames(gif_path):
         List of PIL Images (RGB)
     """
     img = Image.open(gif_path)
-    frames = []
 
-    try:
-        while True:
-            # Convert to RGBA to handle transparency
-            frame = img.convert("RGBA")
+    # Frames decode in order, so first snapshot every frame as it is reached
+    raw_frames = [frame.copy() for frame in ImageSequence.Iterator(img)]
 
-            # Composite onto white background (transparent -> white)
-            background = Image.new("RGBA", frame.size, (255, 255, 255, 255))
-            frame = Image.alpha_composite(background, frame)
-            frame = frame.convert("RGB")
+    # PIL releases the GIL while converting and compositing, so threads flatten
+    # the frames in parallel without any pickling
+    with ThreadPoolExecutor() as executor:
+        return list(executor.map(composite_on_white, raw_frames))
 
-            frames.append(frame.copy())
-            img.seek(img.tell() + 1)  # Move to next frame
-    except EOFError:
-        pass  # End of frames
 
-    return frames
+@contextmanager
+def open_video(video_path):
+    """
+    Open a video with OpenCV, releasing the capture when the block exits.
+
+    Args:
+        video_path: Path to video file
+
+    Yields:
+        Opened cv2.VideoCapture
+
+    Raises:
+        OSError: If OpenCV cannot open the file
+    """
+    # Let OpenCV decode on the GPU (VAAPI, D3D11, CUDA...) when the backend
+    # supports it; it falls back to software decoding otherwise
+    cap = cv2.VideoCapture(
+        str(video_path),
+        cv2.CAP_ANY,
+        [cv2.CAP_PROP_HW_ACCELERATION, cv2.VIDEO_ACCELERATION_ANY],
+    )
+    try:
+        if not cap.isOpened():
+            raise OSError(f"Could not open video: {video_path}")
+        yield cap
+    finally:
+        cap.release()
 
 
 def extract_video_frames(video_path, num_frames=10):
     """
-    Extract evenly-spaced frames from a video file using OpenCV.
+    Extract evenly-spaced frames from a video file using OpenCV,
+    decoding the stream in a single forward pass.
 
     Args:
         video_path: Path to video file (MP4, AVI, MOV, etc.)
@@ -205,31 +412,44 @@ def extract_video_frames(video_path, num_frames=10):
 
     Returns:
         List of PIL Images (RGB)
-    """
-    cap = cv2.VideoCapture(str(video_path))
-
-    # Get total frame count
-    total_frames = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
-    if total_frames <= 0:
-        total_frames = 1000  # Fallback for streams
 
+    Raises:
+        OSError: If OpenCV cannot open the file
+    """
     frames = []
 
-    # Calculate which frames to extract (evenly spaced)
-    frame_indices = [int(i * total_frames / num_frames) for i in range(num_frames)]
+    with open_video(video_path) as cap:
+        # Get total frame count
+        total_frames = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
+        if total_frames <= 0:
+            total_frames = 1000  # Fallback for streams
+
+        # Calculate which frames to extract (evenly spaced)
+        frame_indices = [int(i * total_frames / num_frames) for i in range(num_frames)]
+
+        # Walk the stream once rather than seeking to each sample: every seek
+        # decodes forward from the nearest keyframe again. grab() steps past a
+        # frame without converting it; only the sampled frames are retrieved.
+        position = 0  # Index of the frame the next grab() returns
+        img = None
+        for idx in frame_indices:
+            if idx >= position:
+                while position <= idx and cap.grab():
+                    position += 1
+                if position <= idx:
+                    break  # Stream ended before this sample
+
+                ret, frame = cap.retrieve()
+                img = None
+                if ret:
+                    # OpenCV uses BGR, convert to RGB for PIL
+                    frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+                    img = Image.fromarray(frame_rgb)
+
+            # Indices repeat when the video has fewer frames than requested
+            if img is not None:
+                frames.append(img)
 
-    for idx in frame_indices:
-        # Seek to frame
-        cap.set(cv2.CAP_PROP_POS_FRAMES, idx)
-        ret, frame = cap.read()
-
-        if ret:
-            # OpenCV uses BGR, convert to RGB for PIL
-            frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-            img = Image.fromarray(frame_rgb)
-            frames.append(img)
-
-    cap.release()
     return frames
 
 
@@ -262,8 +482,35 @@ def extract_frames(file_path, num_frames=10):
 # MAIN PROCESSING
 # =============================================================================
 
+@contextmanager
+def open_replacing(path, buffering=-1):
+    """
+    Open a text file that replaces path only if the block completes.
+
+    Output goes to a temporary file in the same directory, which is moved over
+    path on success and deleted on failure, so an interrupted run never leaves
+    a truncated file behind.
+
+    Args:
+        path: Path of the file to write
+        buffering: Buffer size passed to open()
+
+    Yields:
+        Text file object open for writing
+    """
+    tmp_path = path.with_name(f".{path.name}.tmp")
+    try:
+        with open(tmp_path, "w", buffering=buffering) as f:
+            yield f
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+    os.replace(tmp_path, path)
+
+
 def process_media(file_path, widths, gradient="minimalist", brightness=1.0,
-                  contrast=2.0, flip=False, invert=False, output_dir=None, num_frames=10):
+                  contrast=2.0, flip=False, invert=False, output_dir=None, num_frames=10,
+                  keep_frames=True):
     """
     Process a media file and output ASCII frames at multiple sizes.
 
@@ -277,6 +524,8 @@ def process_media(file_path, widths, gradient="minimalist", brightness=1.0,
         invert: If True, invert colors (for light backgrounds)
         output_dir: Directory to save output files (None = don't save)
         num_frames: Number of frames to extract from videos
+        keep_frames: If False, frames are only streamed to output_dir and the
+            returned lists stay empty
 
     Returns:
         Dict mapping size keys to lists of ASCII strings
@@ -286,33 +535,7 @@ def process_media(file_path, widths, gradient="minimalist", brightness=1.0,
     frames = extract_frames(file_path, num_frames=num_frames)
     print(f"Extracted {len(frames)} frames from {file_path}")
 
-    results = {}
-
-    # Process each width
-    for width in widths:
-        size_key = f"w{width}"
-        results[size_key] = []
-
-        for i, frame in enumerate(frames):
-            # Apply image adjustments
-            adjusted = adjust_image(
-                frame,
-                brightness=brightness,
-                contrast=contrast,
-                invert=invert
-            )
-
-            # Flip horizontally if requested (for left/right variants)
-            if flip:
-                adjusted = ImageOps.mirror(adjusted)
-
-            # Convert to ASCII
-            ascii_art = image_to_ascii(adjusted, width=width, gradient=gradient)
-            results[size_key].append(ascii_art)
-
-            print(f"  Width {width}, Frame {i + 1}/{len(frames)} done")
-
-    # Save output files
+    output_path = None
     if output_dir:
         output_path = Path(output_dir)
         output_path.mkdir(parents=True, exist_ok=True)
@@ -322,23 +545,69 @@ def process_media(file_path, widths, gradient="minimalist", brightness=1.0,
         if not init_file.exists():
             init_file.write_text(f"# ASCII frames generated from: {Path(file_path).name}\n")
 
-        for size_key, ascii_frames in results.items():
-            # Save Python-ready .py file with FRAMES array
-            py_file = output_path / f"{size_key}_frames.py"
-            with open(py_file, 'w') as f:
-                f.write(f'"""{size_key} frames ({len(ascii_frames)} total)."""\n')
-                f.write(f"# Generated from: {Path(file_path).name}\n")
-                f.write(f"# Settings: contrast={contrast}, brightness={brightness}")
-                f.write(f", invert={invert}, flip={flip}\n\n")
-                f.write("FRAMES = [\n")
-                for frame in ascii_frames:
-                    f.write('    """\\\n')
-                    for line in frame.split('\n'):
-                        f.write(f'{line}\n')
-                    f.write('""",\n')
-                f.write("]\n")
-
-            print(f"Saved {size_key}_frames.py to {output_path}")
+    # Each distinct width once, in the order given
+    widths = list(dict.fromkeys(widths))
+    results = {f"w{width}": [] for width in widths}
+
+    with ExitStack() as files:
+        # One Python-ready .py file (FRAMES array) per width, open for the
+        # whole run so every frame is streamed in as soon as it is converted.
+        # Existing files are only replaced once every frame has been written.
+        py_files = {}
+        if output_path:
+            for size_key in results:
+                py_file = files.enter_context(
+                    open_replacing(output_path / f"{size_key}_frames.py", buffering=1 << 20)
+                )
+                py_file.write(
+                    f'"""{size_key} frames ({len(frames)} total)."""\n'
+                    f"# Generated from: {Path(file_path).name}\n"
+                    f"# Settings: contrast={contrast}, brightness={brightness}"
+                    f", invert={invert}, flip={flip}\n\n"
+                    "FRAMES = [\n"
+                )
+                py_files[size_key] = py_file
+
+        # Every frame converts independently, so the work is spread over a
+        # process pool, one task per frame
+        with ProcessPoolExecutor() as executor:
+            # Adjustments don't depend on the output width, so each frame is
+            # prepared once, then converted to every width, all inside the
+            # same worker
+            conversions = executor.map(
+                partial(convert_frame, widths=widths, gradient=gradient,
+                        brightness=brightness, contrast=contrast,
+                        flip=flip, invert=invert),
+                frames
+            )
+
+            # Collect frames in order. Progress is one line rewritten in
+            # place, at most every PROGRESS_INTERVAL seconds and on the last
+            # frame, instead of a printed line per frame.
+            label = ', '.join(map(str, widths))
+            next_progress = 0.0
+            for i, ascii_by_width in enumerate(conversions):
+                for width in widths:
+                    size_key = f"w{width}"
+                    ascii_art = ascii_by_width[width]
+                    if size_key in py_files:
+                        py_files[size_key].write(f'    """\\\n{ascii_art}\n""",\n')
+                    if keep_frames:
+                        results[size_key].append(ascii_art)
+
+                now = time.monotonic()
+                if now >= next_progress or i + 1 == len(frames):
+                    next_progress = now + PROGRESS_INTERVAL
+                    sys.stdout.write(f"\r  Frame {i + 1}/{len(frames)} done at widths {label}")
+                    sys.stdout.flush()
+            if frames:
+                sys.stdout.write("\n")
+
+        for py_file in py_files.values():
+            py_file.write("]\n")
+
+    for size_key in py_files:
+        print(f"Saved {size_key}_frames.py to {output_path}")
 
     return results
 
@@ -396,7 +665,9 @@ Examples:
         flip=args.flip,
         invert=args.invert,
         output_dir=args.output,
-        num_frames=args.frames
+        num_frames=args.frames,
+        # Frames already on disk needn't stay in memory, unless previewed
+        keep_frames=args.preview or not args.output
     )
 
     # Preview first frame if requested